@@ -1,21 +1,39 @@
-# slack.py
+# hubspot.py
 
-import json
+import asyncio
+import hmac
+import logging
 import os
+import random
+import secrets
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, List, Optional
-from urllib.parse import urlencode
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
 from dotenv import load_dotenv
-import dateutil.parser
 
 load_dotenv()
 
-import aiohttp
+import httpx
+import msgpack
+import orjson
 from fastapi import HTTPException, Request
 from redis_client import redis_client
 
 from .integration_item import IntegrationItem
 
+__all__ = [
+    "authorize_hubspot",
+    "oauth2callback_hubspot",
+    "get_hubspot_credentials",
+    "get_items_hubspot",
+    "batch_read",
+    "close_hubspot_client",
+]
+
+logger = logging.getLogger(__name__)
+
 # HubSpot API configuration
 HUBSPOT_CLIENT_ID = os.getenv("HUBSPOT_CLIENT_ID")
 HUBSPOT_CLIENT_SECRET = os.getenv("HUBSPOT_CLIENT_SECRET")
@@ -31,27 +49,97 @@ HUBSPOT_SCOPES = [
 HUBSPOT_AUTH_URL = "https://app.hubspot.com/oauth/authorize"
 HUBSPOT_TOKEN_URL = "https://api.hubapi.com/oauth/v1/token"
 HUBSPOT_API_BASE = "https://api.hubapi.com"
+HUBSPOT_API_URL = f"{HUBSPOT_API_BASE}/"
+
+if not (HUBSPOT_CLIENT_ID and HUBSPOT_CLIENT_SECRET):
+    raise RuntimeError("HubSpot client configuration is missing")
+
+# Everything in the authorization URL except the state is fixed at import time
+import weakref
+_SCOPES_JOINED = " ".join(HUBSPOT_SCOPES)
+_AUTH_URL_PREFIX = f"{HUBSPOT_AUTH_URL}?" + urlencode({
+    "client_id": HUBSPOT_CLIENT_ID,
+    "redirect_uri": HUBSPOT_REDIRECT_URI,
+    "scope": _SCOPES_JOINED,
+})
+
+# Only the properties read into IntegrationItems are requested from HubSpot
+HUBSPOT_CONTACT_PROPERTIES = ["firstname", "lastname"]
+HUBSPOT_COMPANY_PROPERTIES = ["name"]
+HUBSPOT_BATCH_READ_LIMIT = 100  # max inputs per batch read request
+HUBSPOT_BATCH_READ_CONCURRENCY = 4  # batch read chunks in flight at once
+
+# Shared HTTP/2 client so requests to HubSpot are multiplexed over kept-alive connections
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30.0,
+)
+
+# Requests rejected with 429 or a 5xx are retried with jittered exponential backoff
+HUBSPOT_MAX_TRIES = 5
+HUBSPOT_RETRY_BACKOFF = 0.5  # seconds, doubled on every retry
+HUBSPOT_MAX_RETRY_DELAY = 10.0  # seconds; caps both Retry-After and the backoff
+
+# Bound in-flight requests per process to stay under HubSpot's burst limit
+HUBSPOT_MAX_CONCURRENT_REQUESTS = 10
+_REQUEST_SLOTS = asyncio.Semaphore(HUBSPOT_MAX_CONCURRENT_REQUESTS)
+
+async def close_hubspot_client() -> None:
+    """
+    Close the shared httpx client. Called on application shutdown.
+    """
+    await _CLIENT.aclose()
+
+# Process-local cache of decoded credentials, keyed by (user_id, org_id)
+CREDENTIALS_CACHE_TTL = 300  # seconds
+TOKEN_REFRESH_MARGIN = 120  # refresh access tokens this many seconds before expiry
+_cred_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+# Held weakly so a key's lock disappears once no caller is holding or waiting on it
+_cred_locks: "weakref.WeakValueDictionary[Tuple[str, str], asyncio.Lock]" = weakref.WeakValueDictionary()
+
+def _credentials_lock(key: Tuple[str, str]) -> asyncio.Lock:
+    lock = _cred_locks.get(key)
+    if lock is None:
+        lock = _cred_locks[key] = asyncio.Lock()
+    return lock
+
+def _get_cached_credentials(key: Tuple[str, str]) -> Optional[Dict[str, str]]:
+    # Hand out copies so callers can update their credentials without touching the cache
+    cached = _cred_cache.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() >= cached[0]:
+        del _cred_cache[key]
+        return None
+    return dict(cached[1])
+
+def _cache_credentials(key: Tuple[str, str], credentials: Dict) -> None:
+    # Callers hold the key's lock, so an older Redis read cannot replace a newer store
+    ttl = min(_token_seconds_remaining(credentials) - 60, CREDENTIALS_CACHE_TTL)
+    if ttl > 0:
+        _cred_cache[key] = (time.monotonic() + ttl, dict(credentials))
+    else:
+        _cred_cache.pop(key, None)
+
+def _same_refresh_token(a: Dict, b: Dict) -> bool:
+    token_a, token_b = a.get("refresh_token"), b.get("refresh_token")
+    return bool(token_a and token_b) and hmac.compare_digest(token_a.encode(), token_b.encode())
+
+def _token_seconds_remaining(credentials: Dict) -> float:
+    # Credentials stored before obtained_at was tracked only know their lifetime
+    obtained_at = credentials.get("obtained_at", time.time())
+    return obtained_at + credentials["expires_in"] - time.time()
 
 async def authorize_hubspot(user_id: str, org_id: str) -> Dict[str, str]:
     """
     Start the OAuth2 flow for HubSpot by generating the authorization URL.
     """
-    if not HUBSPOT_CLIENT_ID or not HUBSPOT_CLIENT_SECRET:
-        raise HTTPException(status_code=500, detail="HubSpot client configuration is missing")
+    nonce = secrets.token_urlsafe(16)
+    state = f"{user_id}:{org_id}:{nonce}"
+    await redis_client.setex(f"hubspot_state:{state}", 3600, nonce)  # Expires in 1 hour
 
-    state = f"{user_id}:{org_id}"
-    await redis_client.setex(f"hubspot_state:{state}", 3600, "1")  # Expires in 1 hour
-
-    # Generate authorization URL
-    params = {
-        "client_id": HUBSPOT_CLIENT_ID,
-        "redirect_uri": HUBSPOT_REDIRECT_URI,
-        "scope": " ".join(HUBSPOT_SCOPES),
-        "state": state,
-    }
-    auth_url = f"{HUBSPOT_AUTH_URL}?{urlencode(params)}"
-    
-    return {"auth_url": auth_url}
+    return {"auth_url": f"{_AUTH_URL_PREFIX}&state={quote(state, safe='')}"}
 
 async def oauth2callback_hubspot(request: Request) -> Dict[str, str]:
     """
@@ -69,158 +157,404 @@ async def oauth2callback_hubspot(request: Request) -> Dict[str, str]:
     if not code or not state:
         raise HTTPException(status_code=400, detail="Missing required parameters")
 
-    # Verify state
-    stored_state = await redis_client.get(f"hubspot_state:{state}")
-    if not stored_state:
+    # Verify state; GETDEL makes each state single-use, and a state with the wrong
+    # nonce misses the key instead of deleting the pending one
+    try:
+        user_id, org_id, nonce = state.split(":")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid state parameter")
+    stored_state = await redis_client.getdel(f"hubspot_state:{state}")
+    if not stored_state or not hmac.compare_digest(stored_state, nonce.encode()):
         raise HTTPException(status_code=400, detail="Invalid state parameter")
 
     # Exchange code for access token
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            HUBSPOT_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "client_id": HUBSPOT_CLIENT_ID,
-                "client_secret": HUBSPOT_CLIENT_SECRET,
-                "redirect_uri": HUBSPOT_REDIRECT_URI,
-                "code": code,
-            },
-        ) as response:
-            if response.status != 200:
-                raise HTTPException(status_code=400, detail="Failed to get access token")
-            
-            token_data = await response.json()
+    response = await _CLIENT.post(
+        HUBSPOT_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "client_id": HUBSPOT_CLIENT_ID,
+            "client_secret": HUBSPOT_CLIENT_SECRET,
+            "redirect_uri": HUBSPOT_REDIRECT_URI,
+            "code": code,
+        },
+    )
+    if response.status_code != 200:
+        raise HTTPException(status_code=400, detail="Failed to get access token")
+    
+    token_data = orjson.loads(response.content)
 
     # Store the credentials
-    user_id, org_id = state.split(":")
     credentials = {
         "access_token": token_data["access_token"],
         "refresh_token": token_data.get("refresh_token"),
         "expires_in": token_data["expires_in"],
         "token_type": token_data["token_type"],
+        "obtained_at": time.time(),
     }
     
-    await redis_client.set(
-        f"hubspot_credentials:{user_id}:{org_id}",
-        json.dumps(credentials)
-    )
+    async with _credentials_lock((user_id, org_id)):
+        await _store_credentials(user_id, org_id, credentials)
 
     return {"message": "Successfully authenticated with HubSpot"}
 
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    # Random jitter spreads out requests that were throttled together, so they
+    # don't all retry at the same moment
+    backoff = min(HUBSPOT_RETRY_BACKOFF * 2 ** attempt, HUBSPOT_MAX_RETRY_DELAY)
+    try:
+        retry_after = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return random.uniform(0, backoff)
+    return min(max(retry_after, 0), HUBSPOT_MAX_RETRY_DELAY) + random.uniform(0, backoff)
+
+async def _with_retry(
+    send: Callable[[], Awaitable[httpx.Response]], max_tries: int = HUBSPOT_MAX_TRIES
+) -> httpx.Response:
+    """
+    Await send() until it returns a response that is not a 429 or 5xx, or max_tries is reached.
+
+    Each attempt holds one of the shared request slots; the slot is released while
+    waiting to retry.
+    """
+    for attempt in range(max_tries - 1):
+        async with _REQUEST_SLOTS:
+            response = await send()
+        if response.status_code != 429 and response.status_code < 500:
+            return response
+        logger.info("HubSpot returned %d, retrying", response.status_code)
+        await asyncio.sleep(_retry_delay(response, attempt))
+    async with _REQUEST_SLOTS:
+        return await send()
+
+def _decode_credentials(stored: bytes) -> Dict:
+    # Credentials written before the switch to msgpack are JSON; a JSON object
+    # never parses as a single msgpack value, so fall back to orjson for those.
+    try:
+        return msgpack.unpackb(stored, raw=False)
+    except ValueError:
+        return orjson.loads(stored)
+
+async def _read_stored_credentials(user_id: str, org_id: str) -> Optional[Dict]:
+    stored = await redis_client.get(f"hubspot_credentials:{user_id}:{org_id}")
+    if not stored:
+        return None
+    return _decode_credentials(stored)
+
 async def get_hubspot_credentials(user_id: str, org_id: str) -> Optional[Dict[str, str]]:
     """
     Retrieve stored HubSpot credentials for a user/org.
+
+    Credentials are cached in-process for at most CREDENTIALS_CACHE_TTL seconds,
+    and never past a minute before the access token expires.
     """
-    credentials = await redis_client.get(f"hubspot_credentials:{user_id}:{org_id}")
-    if not credentials:
-        return None
-    return json.loads(credentials)
+    key = (user_id, org_id)
+    credentials = _get_cached_credentials(key)
+    if credentials is not None:
+        return credentials
+
+    # One Redis read per key at a time; concurrent callers wait for the cache fill
+    async with _credentials_lock(key):
+        credentials = _get_cached_credentials(key)
+        if credentials is not None:
+            return credentials
+
+        credentials = await _read_stored_credentials(user_id, org_id)
+        if credentials is None:
+            return None
+        _cache_credentials(key, credentials)
+        return credentials
 
 async def refresh_access_token(refresh_token: str) -> Dict[str, str]:
     """
     Refresh the HubSpot access token using the refresh token.
     """
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            HUBSPOT_TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "client_id": HUBSPOT_CLIENT_ID,
-                "client_secret": HUBSPOT_CLIENT_SECRET,
-                "refresh_token": refresh_token,
-            },
-        ) as response:
-            if response.status != 200:
-                raise HTTPException(status_code=400, detail="Failed to refresh access token")
-            
-            return await response.json()
-
-async def get_items_hubspot(credentials_str: str) -> List[IntegrationItem]:
+    response = await _with_retry(lambda: _CLIENT.post(
+        HUBSPOT_TOKEN_URL,
+        data={
+            "grant_type": "refresh_token",
+            "client_id": HUBSPOT_CLIENT_ID,
+            "client_secret": HUBSPOT_CLIENT_SECRET,
+            "refresh_token": refresh_token,
+        },
+    ))
+    if response.status_code != 200:
+        raise HTTPException(status_code=400, detail="Failed to refresh access token")
+    
+    return orjson.loads(response.content)
+
+async def _send(
+    method: str, url: str, headers: Dict[str, str], body: Optional[Dict] = None
+) -> Tuple[int, Optional[Dict]]:
+    """
+    Issue a request over the shared client. The body is only decoded on success.
+    """
+    content = orjson.dumps(body) if body is not None else None
+    response = await _with_retry(
+        lambda: _CLIENT.request(method, url, headers=headers, content=content)
+    )
+    if not response.is_success:
+        return response.status_code, None
+    return response.status_code, orjson.loads(response.content)
+
+async def _store_credentials(user_id: str, org_id: str, credentials: Dict) -> None:
+    """
+    Persist credentials to Redis and the in-process cache. The caller must hold the key's lock.
+    """
+    await redis_client.set(
+        f"hubspot_credentials:{user_id}:{org_id}",
+        msgpack.packb(credentials)
+    )
+    _cache_credentials((user_id, org_id), credentials)
+
+async def _verified_owner(
+    credentials: Dict, user_id: Optional[str], org_id: Optional[str]
+) -> Optional[Tuple[str, str]]:
+    """
+    Return (user_id, org_id) if the posted credentials belong to that user/org's stored connection.
+
+    Posted credentials come from the client, so the stored entry is only read from or
+    written to when the refresh tokens match.
+    """
+    if not (user_id and org_id and credentials.get("refresh_token")):
+        return None
+    stored = await get_hubspot_credentials(user_id, org_id)
+    if not stored or not _same_refresh_token(stored, credentials):
+        return None
+    return user_id, org_id
+
+async def _apply_refreshed_token(credentials: Dict) -> None:
+    new_tokens = await refresh_access_token(credentials["refresh_token"])
+    credentials["access_token"] = new_tokens["access_token"]
+    credentials["refresh_token"] = new_tokens.get("refresh_token", credentials["refresh_token"])
+    credentials["expires_in"] = new_tokens["expires_in"]
+    credentials["obtained_at"] = time.time()
+
+async def _refresh_credentials(
+    credentials: Dict, owner: Optional[Tuple[str, str]], stale_token: str
+) -> Dict:
+    """
+    Replace stale_token in credentials, in place, and persist the result for a verified owner.
+
+    A verified owner's refreshes run under its lock, so concurrent callers wait for a
+    single refresh and then reuse its result. Unverified credentials belong to this
+    request alone and are refreshed without any shared state.
+    """
+    if not owner:
+        # Another request sharing this dict may already have refreshed it
+        if credentials["access_token"] == stale_token:
+            await _apply_refreshed_token(credentials)
+        return credentials
+
+    async with _credentials_lock(owner):
+        # Another request sharing this dict already refreshed it
+        if credentials["access_token"] != stale_token:
+            return credentials
+
+        # Another fetch may have refreshed and stored a new token while we waited
+        stored = await _read_stored_credentials(*owner)
+        if not stored or not _same_refresh_token(stored, credentials):
+            # Reconnected in the meantime; don't overwrite the newer connection
+            await _apply_refreshed_token(credentials)
+            return credentials
+        if stored["access_token"] != stale_token and _token_seconds_remaining(stored) >= TOKEN_REFRESH_MARGIN:
+            credentials.update(stored)
+            return credentials
+
+        await _apply_refreshed_token(credentials)
+        await _store_credentials(*owner, credentials)
+    return credentials
+
+async def _ensure_fresh_credentials(credentials: Dict, owner: Optional[Tuple[str, str]]) -> Dict:
+    """
+    Return credentials whose access token is not about to expire, refreshing it if needed.
+    """
+    if _token_seconds_remaining(credentials) >= TOKEN_REFRESH_MARGIN or not credentials.get("refresh_token"):
+        return credentials
+
+    logger.info("HubSpot access token about to expire, refreshing")
+    return await _refresh_credentials(credentials, owner, credentials["access_token"])
+
+async def _run_concurrently(coros: List[Coroutine[Any, Any, Any]]) -> List[Any]:
+    """
+    Run coroutines concurrently and return their results in order.
+
+    The first failure cancels the remaining tasks and is re-raised unwrapped, so an
+    HTTPException keeps its status instead of surfacing as an ExceptionGroup.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0]
+    return [task.result() for task in tasks]
+
+def _auth_headers(credentials: Dict) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {credentials['access_token']}",
+        "Content-Type": "application/json",
+    }
+
+async def _make_request(
+    endpoint: str,
+    credentials: Dict,
+    headers: Dict[str, str],
+    owner: Optional[Tuple[str, str]],
+    method: str = "GET",
+    body: Optional[Dict] = None,
+) -> Dict:
+    """
+    Make an authenticated request against the HubSpot API.
+
+    On a 401 the token is refreshed once and the shared headers dict is updated
+    in place, so later requests in the same fetch pick up the new token. Requests
+    rejected with the same token share a single refresh.
+    """
+    url = HUBSPOT_API_URL + endpoint
+    sent_token = headers["Authorization"].removeprefix("Bearer ")
+    status, data = await _send(method, url, headers, body)
+    if status == 401 and credentials.get("refresh_token"):
+        logger.info("HubSpot access token expired, refreshing")
+        await _refresh_credentials(credentials, owner, sent_token)
+        headers["Authorization"] = f"Bearer {credentials['access_token']}"
+        status, data = await _send(method, url, headers, body)
+    if data is None:
+        raise HTTPException(status_code=status, detail="Failed to fetch HubSpot data")
+    return data
+
+async def _paginate(
+    endpoint: str,
+    properties: List[str],
+    credentials: Dict,
+    headers: Dict[str, str],
+    owner: Optional[Tuple[str, str]],
+) -> AsyncIterator[Dict]:
+    """
+    Yield every record of a CRM list endpoint, following the paging cursor.
+    """
+    params = {"limit": 100, "properties": ",".join(properties)}
+    while True:
+        data = await _make_request(f"{endpoint}?{urlencode(params)}", credentials, headers, owner)
+        for record in data.get("results", []):
+            yield record
+        after = data.get("paging", {}).get("next", {}).get("after")
+        if not after:
+            break
+        params["after"] = after
+
+async def _fetch_all(
+    endpoint: str,
+    properties: List[str],
+    credentials: Dict,
+    headers: Dict[str, str],
+    owner: Optional[Tuple[str, str]],
+) -> List[Dict]:
+    return [record async for record in _paginate(endpoint, properties, credentials, headers, owner)]
+
+async def get_items_hubspot(
+    credentials_str: str, user_id: Optional[str] = None, org_id: Optional[str] = None
+) -> List[IntegrationItem]:
     """
     Fetch contacts and companies from HubSpot and return them as IntegrationItems.
+
+    Refreshed tokens are only written back to the user/org's stored connection
+    when the posted credentials match it.
     """
-    print("\n=== FETCHING HUBSPOT DATA ===")
+    credentials = orjson.loads(credentials_str)
+    owner = await _verified_owner(credentials, user_id, org_id)
+    credentials = await _ensure_fresh_credentials(credentials, owner)
+    headers = _auth_headers(credentials)
     
-    credentials = json.loads(credentials_str)
-    access_token = credentials["access_token"]
-    
-    items = []
-    
-    # Helper function to make authenticated requests
-    async def make_request(endpoint: str) -> Dict:
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            }
-            async with session.get(f"{HUBSPOT_API_BASE}/{endpoint}", headers=headers) as response:
-                if response.status == 401 and credentials.get("refresh_token"):
-                    print("Token expired, refreshing...")
-                    new_tokens = await refresh_access_token(credentials["refresh_token"])
-                    headers["Authorization"] = f"Bearer {new_tokens['access_token']}"
-                    async with session.get(f"{HUBSPOT_API_BASE}/{endpoint}", headers=headers) as retry_response:
-                        return await retry_response.json()
-                elif response.status != 200:
-                    raise HTTPException(status_code=response.status, detail="Failed to fetch HubSpot data")
-                return await response.json()
-
-    # Helper function to parse ISO datetime
+    # Helper function to parse ISO datetime (Python 3.11+ accepts the trailing "Z")
     def parse_datetime(date_str: str) -> datetime:
-        return dateutil.parser.parse(date_str)
+        return datetime.fromisoformat(date_str)
 
-    # Fetch contacts
-    print("\n--- Fetching Contacts ---")
-    contacts_response = await make_request("crm/v3/objects/contacts")
-    print(f"Found {len(contacts_response.get('results', []))} contacts")
-    
-    for contact in contacts_response.get("results", []):
-        name = f"{contact['properties'].get('firstname', '')} {contact['properties'].get('lastname', '')}".strip()
-        print(f"Contact: {name}")
-        print(f"  ID: {contact['id']}")
-        print(f"  Created: {contact['createdAt']}")
-        print(f"  Updated: {contact['updatedAt']}")
-        
-        items.append(
-            IntegrationItem(
-                id=contact["id"],
-                type="contact",
-                name=name,
-                creation_time=parse_datetime(contact["createdAt"]),
-                last_modified_time=parse_datetime(contact["updatedAt"]),
-                url=f"https://app.hubspot.com/contacts/{contact['id']}",
-            )
-        )
+    # HubSpot returns null for properties that are requested but not set
+    def contact_name(properties: Dict) -> str:
+        return f"{properties.get('firstname') or ''} {properties.get('lastname') or ''}".strip()
 
-    # Fetch companies
-    print("\n--- Fetching Companies ---")
-    companies_response = await make_request("crm/v3/objects/companies")
-    print(f"Found {len(companies_response.get('results', []))} companies")
-    
-    for company in companies_response.get("results", []):
-        name = company["properties"].get("name", "Unnamed Company")
-        print(f"Company: {name}")
-        print(f"  ID: {company['id']}")
-        print(f"  Created: {company['createdAt']}")
-        print(f"  Updated: {company['updatedAt']}")
-        
-        items.append(
-            IntegrationItem(
-                id=company["id"],
-                type="company",
-                name=name,
-                creation_time=parse_datetime(company["createdAt"]),
-                last_modified_time=parse_datetime(company["updatedAt"]),
-                url=f"https://app.hubspot.com/companies/{company['id']}",
-            )
+    # Fetch contacts and companies concurrently; a failure in one stops the other
+    contacts, companies = await _run_concurrently([
+        _fetch_all("crm/v3/objects/contacts", HUBSPOT_CONTACT_PROPERTIES, credentials, headers, owner),
+        _fetch_all("crm/v3/objects/companies", HUBSPOT_COMPANY_PROPERTIES, credentials, headers, owner),
+    ])
+
+    contact_items = [
+        IntegrationItem(
+            id=contact["id"],
+            type="contact",
+            name=contact_name(contact["properties"]),
+            creation_time=parse_datetime(contact["createdAt"]),
+            last_modified_time=parse_datetime(contact["updatedAt"]),
+            url=f"https://app.hubspot.com/contacts/{contact['id']}",
         )
+        for contact in contacts
+    ]
+    company_items = [
+        IntegrationItem(
+            id=company["id"],
+            type="company",
+            name=company["properties"].get("name") or "Unnamed Company",
+            creation_time=parse_datetime(company["createdAt"]),
+            last_modified_time=parse_datetime(company["updatedAt"]),
+            url=f"https://app.hubspot.com/companies/{company['id']}",
+        )
+        for company in companies
+    ]
+
+    logger.info("hubspot fetch: %d contacts, %d companies", len(contact_items), len(company_items))
+
+    return contact_items + company_items
+
+async def batch_read(
+    credentials: Dict,
+    object_type: str,
+    ids: List[str],
+    properties: List[str],
+    user_id: Optional[str] = None,
+    org_id: Optional[str] = None,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Fetch known HubSpot records by ID with the CRM batch read endpoint.
 
-    print("\n=== SUMMARY ===")
-    print(f"Total items fetched: {len(items)}")
-    print(f"Contacts: {len([i for i in items if i.type == 'contact'])}")
-    print(f"Companies: {len([i for i in items if i.type == 'company'])}")
-    print("==============\n")
+    IDs are sent in chunks of HUBSPOT_BATCH_READ_LIMIT, one POST per chunk,
+    instead of one GET per record. At most HUBSPOT_BATCH_READ_CONCURRENCY chunks
+    are in flight, so a large batch cannot use up HubSpot's burst limit by itself.
 
-    return items
+    Returns (records, errors). errors holds any per-ID errors that HubSpot reported
+    with a 207 Multi-Status, such as IDs that were not found.
+    """
+    owner = await _verified_owner(credentials, user_id, org_id)
+    credentials = await _ensure_fresh_credentials(credentials, owner)
+    headers = _auth_headers(credentials)
+    endpoint = f"crm/v3/objects/{object_type}/batch/read"
+
+    fan_out = asyncio.Semaphore(HUBSPOT_BATCH_READ_CONCURRENCY)
+
+    async def read_chunk(chunk: List[str]) -> Dict:
+        async with fan_out:
+            return await _make_request(
+                endpoint,
+                credentials,
+                headers,
+                owner,
+                method="POST",
+                body={"inputs": [{"id": record_id} for record_id in chunk], "properties": properties},
+            )
+
+    responses = await _run_concurrently([
+        read_chunk(ids[i:i + HUBSPOT_BATCH_READ_LIMIT])
+        for i in range(0, len(ids), HUBSPOT_BATCH_READ_LIMIT)
+    ])
+    records = [record for response in responses for record in response.get("results", [])]
+    errors = [error for response in responses for error in response.get("errors", [])]
+    if errors:
+        logger.warning(
+            "hubspot batch read of %s: %d errors: %s",
+            object_type,
+            len(errors),
+            [(error.get("category"), error.get("context", {}).get("ids")) for error in errors],
+        )
+    return records, errors
 
 async def create_integration_item_metadata_object(response_json):
     # TODO
@@ -1,9 +1,11 @@
+from typing import Optional
+
 from fastapi import FastAPI, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from integrations.airtable import authorize_airtable, get_items_airtable, oauth2callback_airtable, get_airtable_credentials
 from integrations.notion import authorize_notion, get_items_notion, oauth2callback_notion, get_notion_credentials
-from integrations.hubspot import authorize_hubspot, get_hubspot_credentials, get_items_hubspot, oauth2callback_hubspot
+from integrations.hubspot import authorize_hubspot, close_hubspot_client, get_hubspot_credentials, get_items_hubspot, oauth2callback_hubspot
 
 app = FastAPI()
 
@@ -19,6 +21,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_hubspot_client()
+
 @app.get('/')
 def read_root():
     return {'Ping': 'Pong'}
@@ -73,5 +79,5 @@ async def get_hubspot_credentials_integration(user_id: str = Form(...), org_id:
     return await get_hubspot_credentials(user_id, org_id)
 
 @app.post('/integrations/hubspot/get_hubspot_items')
-async def load_slack_data_integration(credentials: str = Form(...)):
-    return await get_items_hubspot(credentials)
+async def load_slack_data_integration(credentials: str = Form(...), user_id: Optional[str] = Form(None), org_id: Optional[str] = Form(None)):
+    return await get_items_hubspot(credentials, user_id, org_id)
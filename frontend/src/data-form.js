@@ -17,7 +17,7 @@ const endpointMapping = {
     'HubSpot': 'hubspot/get_hubspot_items',
 };
 
-export const DataForm = ({ integrationType, credentials }) => {
+export const DataForm = ({ integrationType, credentials, user, org }) => {
     const [loadedData, setLoadedData] = useState(null);
     const [loading, setLoading] = useState(false);
     const endpoint = endpointMapping[integrationType];
@@ -27,6 +27,8 @@ export const DataForm = ({ integrationType, credentials }) => {
             setLoading(true);
             const formData = new FormData();
             formData.append('credentials', JSON.stringify(credentials));
+            formData.append('user_id', user);
+            formData.append('org_id', org);
             const response = await axios.post(`http://localhost:8000/integrations/${endpoint}`, formData);
             const data = response.data;
             setLoadedData(data);
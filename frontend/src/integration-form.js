@@ -52,7 +52,7 @@ export const IntegrationForm = () => {
         }
         {integrationParams?.credentials && 
         <Box sx={{mt: 2}}>
-            <DataForm integrationType={integrationParams?.type} credentials={integrationParams?.credentials} />
+            <DataForm integrationType={integrationParams?.type} credentials={integrationParams?.credentials} user={user} org={org} />
         </Box>
         }
     </Box>